@@ -1,7 +1,6 @@
 from dataclasses import dataclass
 from typing import Dict, Tuple, List, Union
 import logging
-import numpy as np
 import re
 from clemcore.backends import Model
 from clemcore.clemgame import (GameSpec, GameMaster, GameBenchmark, Player, DialogueGameMaster, GameScorer,
@@ -198,7 +197,7 @@ class GetToThePointGameScorer(GameScorer):
         elif interactions[METRIC_LOSE]:
             self.log_episode_score(BENCH_SCORE, 0)
         elif interactions[METRIC_ABORTED]:
-            self.log_episode_score(BENCH_SCORE, np.nan)
+            self.log_episode_score(BENCH_SCORE, float('nan'))
         else:
             raise ValueError("Missing outcome value (success, failure, abort) in interactions.json")
 
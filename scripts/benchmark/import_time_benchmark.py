@@ -0,0 +1,98 @@
+import argparse
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+
+# Measures how long `clem list games`, the game module and the data generation scripts
+# take to start, optionally next to the same files taken from an older git revision.
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+GAME_DIR = os.path.join('clembench', 'gettothepoint')
+SCRIPTS_DIR = os.path.join('scripts', 'data_generation')
+
+# (label, directory relative to the repo root, module to import)
+MODULE_TARGETS = [
+    ("game master (scorer-only runs)", GAME_DIR, "master"),
+    ("instance generator", GAME_DIR, "instancegenerator"),
+    ("word gathering (english)", SCRIPTS_DIR, "get_to_the_point_word_gathering_eng_template"),
+    ("word gathering (urdu)", SCRIPTS_DIR, "get_to_the_point_word_gathering_urdu_template"),
+    ("word generator (english)", SCRIPTS_DIR, "get_to_the_point_word_generator_eng_template"),
+    ("word generator (urdu)", SCRIPTS_DIR, "get_to_the_point_word_generator_urdu_template"),
+    ("similarity index", SCRIPTS_DIR, "get_to_the_point_similarity_index"),
+]
+N_RUNS = 5
+
+
+def time_command(command, cwd, n_runs):
+    """Returns the median wall time of the command in seconds, or None if it fails."""
+    durations = []
+    for _ in range(n_runs):
+        start = time.perf_counter()
+        completed = subprocess.run(command, cwd=cwd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+        if completed.returncode != 0:
+            last_line = completed.stderr.strip().splitlines()[-1] if completed.stderr.strip() else "no output"
+            print(f"  '{' '.join(command)}' failed in {cwd}: {last_line}")
+            return None
+        durations.append(time.perf_counter() - start)
+    return statistics.median(durations)
+
+
+def export_revision(ref, target_dir):
+    """Writes the game and script directories as of the given git revision to target_dir."""
+    for directory in (GAME_DIR, SCRIPTS_DIR):
+        archive = subprocess.run(['git', 'archive', ref, directory], cwd=REPO_ROOT, stdout=subprocess.PIPE,
+                                 check=True)
+        subprocess.run(['tar', '-x', '-C', target_dir], input=archive.stdout, check=True)
+
+
+def format_seconds(value):
+    return "failed" if value is None else f"{value * 1000:8.1f} ms"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import-time benchmark for the game module and scripts.")
+    parser.add_argument("--ref", help="Git revision to compare against, e.g. the commit before lazy imports")
+    parser.add_argument("--runs", type=int, default=N_RUNS)
+    args = parser.parse_args()
+
+    roots = {"current": REPO_ROOT}
+    tmp_dir = None
+    if args.ref:
+        tmp_dir = tempfile.mkdtemp(prefix="import_benchmark_")
+        export_revision(args.ref, tmp_dir)
+        roots[args.ref] = tmp_dir
+
+    try:
+        print(f"Median wall time over {args.runs} runs (interpreter start-up included):")
+        baseline = time_command([sys.executable, '-c', 'pass'], REPO_ROOT, args.runs)
+        print(f"  {'python -c pass':<34}{format_seconds(baseline)}")
+
+        if shutil.which('clem'):
+            results = [f"{name}: {format_seconds(time_command(['clem', 'list', 'games'], root, args.runs))}"
+                       for name, root in roots.items()]
+            print(f"  {'clem list games':<34}{'   '.join(results)}")
+        else:
+            print("  clem not found on PATH, skipping 'clem list games'")
+
+        for label, directory, module in MODULE_TARGETS:
+            results = []
+            for name, root in roots.items():
+                if not os.path.exists(os.path.join(root, directory, f'{module}.py')):
+                    results.append(f"{name}: {'n/a':>11}")
+                    continue
+                duration = time_command([sys.executable, '-c', f'import {module}'], os.path.join(root, directory),
+                                        args.runs)
+                results.append(f"{name}: {format_seconds(duration)}")
+            print(f"  {label:<34}{'   '.join(results)}")
+    finally:
+        if tmp_dir:
+            shutil.rmtree(tmp_dir)
+
+
+if __name__ == "__main__":
+    main()
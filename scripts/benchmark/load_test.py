@@ -0,0 +1,122 @@
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+from mock_openai_server import add_server_arguments, create_server, state_from_arguments
+from shard_benchmark import GAME, GAME_DIR, instances_name, load_instances, split_instances
+
+
+# Runs GetToThePoint end to end against the mock server: the game is copied into a
+# scratch workspace whose model_registry.json and key.json point the openai_compatible
+# backend at the mock, instances are spread over parallel clem processes, and the
+# number of finished episodes per second is reported.
+
+HELPER_MODEL = "mock-helper"
+SEEKER_MODEL = "mock-seeker"
+
+
+def mock_model_entry(model_name):
+    return {
+        "model_name": model_name,
+        "model_id": model_name,
+        "backend": "openai_compatible",
+        "release_date": "2025-01-01",
+        "open_weight": True,
+        "parameters": "0B",
+        "languages": ["en", "ur"],
+        "context_size": "100k",
+        "license": {},
+        "model_config": {}
+    }
+
+
+def repeat_instances(instances, n_episodes):
+    """Cycles through the instances of every experiment until each has n_episodes game instances."""
+    experiments = []
+    for experiment in instances['experiments']:
+        source = experiment['game_instances']
+        if not source:
+            continue
+        game_instances = [dict(source[i % len(source)], game_id=i) for i in range(n_episodes)]
+        experiments.append({**experiment, 'game_instances': game_instances})
+    return {**instances, 'experiments': experiments}
+
+
+def prepare_workspace(workspace, base_url, language, n_episodes, n_processes):
+    game_dir = os.path.join(workspace, 'clembench', 'gettothepoint')
+    shutil.copytree(GAME_DIR, game_dir, ignore=shutil.ignore_patterns('__pycache__'))
+
+    instances = repeat_instances(load_instances(language), n_episodes)
+    for shard, shard_instances in enumerate(split_instances(instances, n_processes)):
+        with open(os.path.join(game_dir, 'in', f'{instances_name(language, shard, n_processes)}.json'), 'w',
+                  encoding='utf-8') as f:
+            json.dump(shard_instances, f, indent=4, ensure_ascii=False)
+
+    with open(os.path.join(workspace, 'model_registry.json'), 'w', encoding='utf-8') as f:
+        json.dump([mock_model_entry(HELPER_MODEL), mock_model_entry(SEEKER_MODEL)], f, indent=4)
+    with open(os.path.join(workspace, 'key.json'), 'w', encoding='utf-8') as f:
+        # the openai_compatible backend reads its credentials under this name
+        json.dump({"generic_openai_compatible": {"api_key": "mock", "base_url": base_url}}, f, indent=4)
+    return sum(len(experiment['game_instances']) for experiment in instances['experiments'])
+
+
+def count_episodes(results_dir):
+    return sum('interactions.json' in files for _, _, files in os.walk(results_dir))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Episodes/sec of GetToThePoint runs against the mock server.")
+    parser.add_argument("language", choices=["english", "urdu"])
+    parser.add_argument("--episodes", type=int, default=20, help="Episodes per experiment")
+    parser.add_argument("--processes", type=int, default=4, help="Parallel clem run processes")
+    parser.add_argument("--keep", action="store_true", help="Keep the workspace and its results")
+    add_server_arguments(parser)
+    args = parser.parse_args()
+
+    server = create_server(state_from_arguments(args), args.host, args.port)
+    host, port = server.server_address[:2]
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    workspace = tempfile.mkdtemp(prefix="gettothepoint_load_test_")
+    try:
+        n_expected = prepare_workspace(workspace, f"http://{host}:{port}/v1", args.language, args.episodes,
+                                       args.processes)
+        print(f"Running {n_expected} episodes in {args.processes} processes against http://{host}:{port}/v1")
+
+        start = time.perf_counter()
+        processes = [subprocess.Popen(['clem', 'run', '-g', GAME, '-m', HELPER_MODEL, SEEKER_MODEL,
+                                       '-i', instances_name(args.language, shard, args.processes),
+                                       '-r', os.path.join(workspace, 'results', f'shard_{shard}')],
+                                      cwd=workspace, stdout=subprocess.DEVNULL)
+                     for shard in range(args.processes)]
+        return_codes = [process.wait() for process in processes]
+        elapsed = time.perf_counter() - start
+
+        failed = [shard for shard, code in enumerate(return_codes) if code != 0]
+        n_episodes = count_episodes(os.path.join(workspace, 'results'))
+        # clem run also exits with 0 when the game cannot be loaded, hence the episode count
+        if len(failed) == len(return_codes) or n_episodes == 0:
+            sys.exit(f"No episode finished, no throughput to report (mock server: {server.state.stats}). "
+                     f"Rerun with --keep and see clembench.log in the workspace.")
+
+        print(f"Finished {n_episodes}/{n_expected} episodes in {elapsed:.1f} s: {n_episodes / elapsed:.2f} episodes/sec")
+        print(f"Mock server: {server.state.stats}")
+        if failed:
+            print(f"Warning: clem run exited with an error for shards {failed}")
+        if args.keep:
+            print(f"Workspace kept at {workspace}")
+    finally:
+        server.shutdown()
+        server.server_close()
+        if not args.keep:
+            shutil.rmtree(workspace)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,234 @@
+import argparse
+import json
+import random
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+# Local stand-in for the openai_compatible backend. Answers /v1/chat/completions with
+# scripted Helper/Seeker turns after a sampled delay, and injects server errors and
+# rate limits at configurable rates.
+
+HOST = "127.0.0.1"
+PORT = 8765
+
+# Same turns as the _custom_response methods in clembench/gettothepoint/player.py
+DEFAULT_SCRIPT = {
+    "helper": ["CLUE:navigator charts ocean currents\nCOT: The clue hints at someone who uses maps and understands "
+               "water flow, directly relating to a navigator profession."],
+    "seeker": ["GUESS:ocean\nCOT: The provided words strongly suggest something related to the sea."],
+}
+
+
+def parse_latency(spec):
+    """
+    Parses a latency distribution in seconds: fixed:S, uniform:MIN:MAX,
+    exponential:MEAN or lognormal:MU:SIGMA. Returns a function drawing one delay.
+    """
+    name, *params = spec.split(":")
+    try:
+        params = [float(p) for p in params]
+        if name == "fixed" and len(params) == 1:
+            return lambda rng: params[0]
+        if name == "uniform" and len(params) == 2:
+            return lambda rng: rng.uniform(*params)
+        if name == "exponential" and len(params) == 1:
+            return lambda rng: rng.expovariate(1 / params[0]) if params[0] > 0 else 0.0
+        if name == "lognormal" and len(params) == 2:
+            return lambda rng: rng.lognormvariate(*params)
+    except ValueError:
+        pass
+    raise argparse.ArgumentTypeError(f"Invalid latency '{spec}', expected fixed:S, uniform:MIN:MAX, "
+                                     f"exponential:MEAN or lognormal:MU:SIGMA")
+
+
+def player_role(model):
+    """
+    Helper or Seeker, from the model name, e.g. mock-helper or mock-seeker; None if the
+    name says neither. The prompts give no reliable hint: both English prompts mention
+    GUESS and CLUE, and the Urdu ones are only filled in from the game's config.
+    """
+    model = model.lower()
+    roles = [role for role in ("helper", "seeker") if role in model]
+    return roles[0] if len(roles) == 1 else None
+
+
+class MockServerState:
+    """Settings shared by all request handler threads, plus request counters."""
+
+    def __init__(self, script=None, latency="fixed:0", error_rate=0.0, rate_limit_rate=0.0, retry_after=1,
+                 seed=None):
+        self.script = script or DEFAULT_SCRIPT
+        self.latency = parse_latency(latency) if isinstance(latency, str) else latency
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.retry_after = retry_after
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+        self.stats = {"requests": 0, "completions": 0, "errors": 0, "rate_limited": 0}
+
+    def draw(self):
+        """Returns the delay and the injected failure (None, 'error' or 'rate_limit') for one request."""
+        with self.lock:
+            self.stats["requests"] += 1
+            delay = max(0.0, self.latency(self.rng))
+            outcome = self.rng.random()
+        if outcome < self.rate_limit_rate:
+            return delay, "rate_limit"
+        if outcome < self.rate_limit_rate + self.error_rate:
+            return delay, "error"
+        return delay, None
+
+    def count(self, key):
+        with self.lock:
+            self.stats[key] += 1
+
+    def response_for(self, role, messages):
+        turns = self.script[role]
+        turn = sum(1 for m in messages if m.get("role") == "assistant")
+        return turns[turn % len(turns)]
+
+
+class MockOpenAIHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    @property
+    def state(self):
+        return self.server.state
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send_json(self, status, body, headers=None):
+        payload = json.dumps(body, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _send_error(self, status, message, error_type, headers=None):
+        self._send_json(status, {"error": {"message": message, "type": error_type, "code": status}}, headers)
+
+    def do_GET(self):
+        if self.path.rstrip("/").endswith("/models"):
+            self._send_json(200, {"object": "list", "data": [
+                {"id": "mock-helper", "object": "model", "owned_by": "mock"},
+                {"id": "mock-seeker", "object": "model", "owned_by": "mock"},
+            ]})
+        elif self.path.rstrip("/") == "/stats":
+            with self.state.lock:
+                self._send_json(200, dict(self.state.stats))
+        else:
+            self._send_error(404, f"Unknown path {self.path}", "invalid_request_error")
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        try:
+            request = json.loads(self.rfile.read(length) or b"{}")
+        except json.JSONDecodeError:
+            self._send_error(400, "Request body is not valid JSON", "invalid_request_error")
+            return
+        if not self.path.rstrip("/").endswith("/chat/completions"):
+            self._send_error(404, f"Unknown path {self.path}", "invalid_request_error")
+            return
+
+        model = request.get("model", "")
+        role = player_role(model)
+        if role is None:
+            self._send_error(400, f"Model '{model}' must name its role, e.g. mock-helper or mock-seeker",
+                             "invalid_request_error")
+            return
+
+        delay, failure = self.state.draw()
+        time.sleep(delay)
+        if failure == "rate_limit":
+            self.state.count("rate_limited")
+            self._send_error(429, "Rate limit reached (injected)", "rate_limit_exceeded",
+                             {"Retry-After": str(self.state.retry_after)})
+            return
+        if failure == "error":
+            self.state.count("errors")
+            self._send_error(500, "Internal server error (injected)", "server_error")
+            return
+
+        messages = request.get("messages", [])
+        content = self.state.response_for(role, messages)
+        self.state.count("completions")
+        prompt_tokens = sum(len(str(m.get("content", "")).split()) for m in messages)
+        completion_tokens = len(content.split())
+        self._send_json(200, {
+            "id": f"chatcmpl-{uuid.uuid4().hex}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": model,
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": "stop"
+            }],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens
+            }
+        })
+
+
+def create_server(state, host=HOST, port=PORT):
+    server = ThreadingHTTPServer((host, port), MockOpenAIHandler)
+    server.daemon_threads = True
+    server.state = state
+    return server
+
+
+def load_script(path):
+    """Loads scripted turns {"helper": [...], "seeker": [...]}, cycled per player turn."""
+    with open(path, 'r', encoding='utf-8') as f:
+        script = json.load(f)
+    missing = {"helper", "seeker"} - set(script)
+    if missing:
+        raise ValueError(f"Script {path} has no responses for {sorted(missing)}")
+    return script
+
+
+def add_server_arguments(parser):
+    parser.add_argument("--host", default=HOST)
+    parser.add_argument("--port", type=int, default=PORT)
+    parser.add_argument("--latency", type=parse_latency, default="fixed:0",
+                        help="fixed:S, uniform:MIN:MAX, exponential:MEAN or lognormal:MU:SIGMA (seconds)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with 500")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="Fraction of requests answered with 429")
+    parser.add_argument("--retry-after", type=int, default=1, help="Retry-After header of 429 responses")
+    parser.add_argument("--script", help="JSON file with scripted helper and seeker turns")
+    parser.add_argument("--seed", type=int)
+
+
+def state_from_arguments(args):
+    return MockServerState(script=load_script(args.script) if args.script else None, latency=args.latency,
+                           error_rate=args.error_rate, rate_limit_rate=args.rate_limit_rate,
+                           retry_after=args.retry_after, seed=args.seed)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mock openai_compatible server for GetToThePoint load tests.")
+    add_server_arguments(parser)
+    args = parser.parse_args()
+
+    server = create_server(state_from_arguments(args), args.host, args.port)
+    print(f"Mock server listening on http://{args.host}:{args.port}/v1")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(f"Served {server.state.stats}")
+
+
+if __name__ == "__main__":
+    main()
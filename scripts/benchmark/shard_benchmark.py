@@ -0,0 +1,245 @@
+import argparse
+import hashlib
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+
+
+# Splits a GetToThePoint instances file into N shards, runs shards as separate clem
+# processes (one per node, or several on one machine), and merges the shard results
+# back into a single results tree.
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+GAME_DIR = os.path.join(REPO_ROOT, 'clembench', 'gettothepoint')
+SHARD_RESULTS_DIR = os.path.join(REPO_ROOT, 'results_shards')
+# keys clem sets per run, they legitimately differ between the shards of one experiment
+RUN_SPECIFIC_EXPERIMENT_KEYS = ('timestamp', 'duration')
+
+EXPERIMENT_DIR_REGEX = re.compile(r'^(\d+)_(.+)$')
+EPISODE_DIR_REGEX = re.compile(r'^episode_(\d+)$')
+
+
+def load_game_name():
+    """The name clem selects the game by (clem run -g), as declared in clemgame.json."""
+    with open(os.path.join(GAME_DIR, 'clemgame.json'), 'r', encoding='utf-8') as f:
+        return json.load(f)['game_name']
+
+
+GAME = load_game_name()
+
+
+def shard_of(experiment_name, game_id, n_shards):
+    """Deterministic shard assignment, independent of instance order and of PYTHONHASHSEED."""
+    digest = hashlib.sha1(f'{experiment_name}/{game_id}'.encode('utf-8')).hexdigest()
+    return int(digest, 16) % n_shards
+
+
+def instances_name(language, shard=None, n_shards=None):
+    if shard is None:
+        return f'instances_{language}'
+    return f'instances_{language}_shard_{shard}_of_{n_shards}'
+
+
+def load_instances(language):
+    with open(os.path.join(GAME_DIR, 'in', f'{instances_name(language)}.json'), 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def split_instances(instances, n_shards):
+    """
+    Returns one instances dict per shard. Every shard keeps all experiments, possibly
+    with no game instances, so experiment directories get the same index prefix
+    (e.g. 0_exp_level_low_english) as in a single-node run.
+    """
+    shards = []
+    for shard in range(n_shards):
+        experiments = []
+        for experiment in instances['experiments']:
+            experiment = dict(experiment)
+            experiment['game_instances'] = [instance for instance in experiment['game_instances']
+                                            if shard_of(experiment['name'], instance['game_id'], n_shards) == shard]
+            experiments.append(experiment)
+        shards.append({**instances, 'experiments': experiments})
+    return shards
+
+
+def write_shards(language, n_shards):
+    for shard, shard_instances in enumerate(split_instances(load_instances(language), n_shards)):
+        path = os.path.join(GAME_DIR, 'in', f'{instances_name(language, shard, n_shards)}.json')
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(shard_instances, f, indent=4, ensure_ascii=False)
+        n_instances = sum(len(experiment['game_instances']) for experiment in shard_instances['experiments'])
+        print(f"Shard {shard}: {n_instances} instances written to {path}")
+
+
+def shard_results_dir(results_root, shard):
+    return os.path.join(results_root, f'shard_{shard}')
+
+
+def run_shards(language, n_shards, models, shards, results_root):
+    """Runs the given shards as parallel clem processes and returns the shards that failed."""
+    processes = {}
+    for shard in shards:
+        command = ['clem', 'run', '-g', GAME, '-m', *models,
+                   '-i', instances_name(language, shard, n_shards),
+                   '-r', shard_results_dir(results_root, shard)]
+        print(f"Starting shard {shard}: {' '.join(command)}")
+        processes[shard] = subprocess.Popen(command, cwd=REPO_ROOT)
+    return [shard for shard, process in processes.items() if process.wait() != 0]
+
+
+def collect_episodes(results_dir):
+    """Maps (model pair, game, experiment dir, episode dir) to the episode path for one results tree."""
+    episodes = {}
+    for dirpath, dirnames, _ in os.walk(results_dir):
+        experiment_dir = os.path.basename(dirpath)
+        if not EXPERIMENT_DIR_REGEX.match(experiment_dir):
+            continue
+        game_dir = os.path.dirname(dirpath)
+        model_pair = os.path.relpath(os.path.dirname(game_dir), results_dir)
+        for episode_dir in dirnames:
+            if EPISODE_DIR_REGEX.match(episode_dir):
+                key = (model_pair, os.path.basename(game_dir), experiment_dir, episode_dir)
+                episodes[key] = os.path.join(dirpath, episode_dir)
+    return episodes
+
+
+def expected_episodes(instances):
+    """
+    Maps (experiment dir, game id) to the experiment name and the episode dir of every
+    instance. clem numbers episodes by their position in the experiment it was given,
+    so the episode dir is the one a single-node run over the full instances file writes.
+    """
+    expected = {}
+    for index, experiment in enumerate(instances['experiments']):
+        for position, instance in enumerate(experiment['game_instances']):
+            key = (f"{index}_{experiment['name']}", instance['game_id'])
+            expected[key] = (experiment['name'], f"episode_{position}")
+    return expected
+
+
+def load_episode_game_id(path):
+    """Reads the game id from the instance.json clem stores in every episode dir, None if it is missing."""
+    instance_file = os.path.join(path, 'instance.json')
+    if not os.path.exists(instance_file):
+        return None
+    with open(instance_file, 'r', encoding='utf-8') as f:
+        return json.load(f).get('game_id')
+
+
+def load_experiment_config(path):
+    """Loads an experiment.json without the keys that differ from run to run."""
+    with open(path, 'r', encoding='utf-8') as f:
+        experiment = json.load(f)
+    return {key: value for key, value in experiment.items() if key not in RUN_SPECIFIC_EXPERIMENT_KEYS}
+
+
+def merge_shards(language, n_shards, results_root, output_dir):
+    """
+    Validates that the shard results together contain every episode exactly once, in
+    the shard it was assigned to, for every model pair, and that the shards agree on
+    each experiment.json apart from its run-specific keys. Episodes are matched by the
+    game id in their instance.json, since each shard numbers its episodes from 0, and
+    are copied into output_dir under the episode dir of a single-node run.
+    Returns the list of problems found; nothing is copied if there are any.
+    """
+    expected = expected_episodes(load_instances(language))
+    problems = []
+    found = {}
+    experiment_files = {}
+    for shard in range(n_shards):
+        shard_dir = shard_results_dir(results_root, shard)
+        if not os.path.isdir(shard_dir):
+            problems.append(f"results of shard {shard} not found at {shard_dir}")
+            continue
+        for (model_pair, game, experiment_dir, _), path in collect_episodes(shard_dir).items():
+            game_id = load_episode_game_id(path)
+            if game_id is None:
+                problems.append(f"no game id found in {os.path.join(path, 'instance.json')}")
+                continue
+            if (experiment_dir, game_id) not in expected:
+                problems.append(f"unexpected episode {path} (game id {game_id})")
+                continue
+            experiment_name, _ = expected[(experiment_dir, game_id)]
+            if shard_of(experiment_name, game_id, n_shards) != shard:
+                problems.append(f"episode {path} belongs to shard {shard_of(experiment_name, game_id, n_shards)}")
+            key = (model_pair, game, experiment_dir, game_id)
+            if key in found:
+                problems.append(f"episode {path} duplicates {found[key]}")
+            found[key] = path
+
+            experiment_file = os.path.join(os.path.dirname(path), 'experiment.json')
+            if not os.path.exists(experiment_file):
+                problems.append(f"{experiment_file} not found")
+                continue
+            first_experiment_file = experiment_files.setdefault(key[:3], experiment_file)
+            if load_experiment_config(experiment_file) != load_experiment_config(first_experiment_file):
+                problems.append(f"{experiment_file} differs from {first_experiment_file}")
+
+    for model_pair, game in sorted({(key[0], key[1]) for key in found}):
+        for (experiment_dir, game_id), (_, episode_dir) in sorted(expected.items()):
+            if (model_pair, game, experiment_dir, game_id) not in found:
+                problems.append(f"missing episode {os.path.join(model_pair, game, experiment_dir, episode_dir)}"
+                                f" (game id {game_id})")
+    if not found:
+        problems.append(f"no episodes found under {results_root}")
+    if problems:
+        return problems
+
+    for (model_pair, game, experiment_dir, game_id), path in sorted(found.items()):
+        _, episode_dir = expected[(experiment_dir, game_id)]
+        shutil.copytree(path, os.path.join(output_dir, model_pair, game, experiment_dir, episode_dir))
+    # one experiment.json per experiment, taken from the lowest shard holding episodes of it
+    for (model_pair, game, experiment_dir), experiment_file in experiment_files.items():
+        shutil.copy2(experiment_file, os.path.join(output_dir, model_pair, game, experiment_dir, 'experiment.json'))
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sharded GetToThePoint runs with a deterministic merge.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    split_parser = subparsers.add_parser("split", help="Write one instances file per shard")
+    run_parser = subparsers.add_parser("run", help="Run shards as clem processes")
+    merge_parser = subparsers.add_parser("merge", help="Validate and merge shard results, then score them")
+    for subparser in (split_parser, run_parser, merge_parser):
+        subparser.add_argument("language", choices=["english", "urdu"])
+        subparser.add_argument("--shards", type=int, required=True, help="Total number of shards")
+
+    run_parser.add_argument("-m", "--models", nargs="+", required=True, help="Helper and Seeker model")
+    run_parser.add_argument("--shard", type=int, action="append",
+                            help="Shard(s) to run on this node, may be repeated. Defaults to all shards.")
+    for subparser in (run_parser, merge_parser):
+        subparser.add_argument("--shard-results", default=SHARD_RESULTS_DIR,
+                               help="Directory holding one results directory per shard")
+    merge_parser.add_argument("-r", "--results-dir", default=os.path.join(REPO_ROOT, 'results'))
+    merge_parser.add_argument("--no-eval", action="store_true", help="Skip clem score and clem eval")
+
+    args = parser.parse_args()
+
+    if args.command == "split":
+        write_shards(args.language, args.shards)
+
+    elif args.command == "run":
+        shards = args.shard if args.shard is not None else range(args.shards)
+        failed = run_shards(args.language, args.shards, args.models, shards, args.shard_results)
+        if failed:
+            sys.exit(f"Shards {failed} did not finish successfully")
+
+    elif args.command == "merge":
+        if os.path.exists(args.results_dir) and os.listdir(args.results_dir):
+            sys.exit(f"Results directory {args.results_dir} is not empty")
+        problems = merge_shards(args.language, args.shards, args.shard_results, args.results_dir)
+        if problems:
+            sys.exit("Merge failed:\n  " + "\n  ".join(problems))
+        print(f"Merged {args.shards} shards into {args.results_dir}")
+        if not args.no_eval:
+            subprocess.run(['clem', 'score', '-r', args.results_dir], cwd=REPO_ROOT, check=True)
+            subprocess.run(['clem', 'eval', '-r', args.results_dir], cwd=REPO_ROOT, check=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,209 @@
+import argparse
+import json
+import os
+from tqdm import tqdm
+
+
+# Per-word sorted-neighbour index. Building it is the only step that touches the
+# embeddings; extracting word_pairs_by_similarity*.json for any set of similarity
+# bands afterwards only reads the index.
+
+INDEX_FILES = {
+    "english": "similarity_index.npz",
+    "urdu": "similarity_index_urdu.npz",
+}
+OUTPUT_FILES = {
+    "english": "word_pairs_by_similarity.json",
+    "urdu": "word_pairs_by_similarity_urdu.json",
+}
+TOP_K = 1000  # neighbours kept per word, must reach below the lowest band used
+BLOCK_SIZE = 1024  # rows of the similarity matrix computed at once
+
+# Same bands and edges as the generator templates: (MIN, MAX, closed side), where
+# "left" means MIN <= sim < MAX (Urdu template) and "right" MIN < sim <= MAX (English template)
+DEFAULT_BANDS = {
+    "english": {"low": (None, 0.40, "right"), "high": (0.60, 0.65, "right")},
+    "urdu": {"low": (0.30, 0.50, "left"), "high": (0.70, 0.90, "left")},
+}
+
+
+def load_word_vectors(language):
+    """Loads the embeddings exactly like the generator template for the language does."""
+    if language == "english":
+        import get_to_the_point_word_generator_eng_template as generator
+        allowed_words = generator.load_filtered_wordlist(generator.WORDLIST_PATH)
+        return generator.load_glove_embeddings(generator.GLOVE_PATH, allowed_words, max_words=generator.MAX_WORDS)
+
+    import get_to_the_point_word_generator_urdu_template as generator
+    model = generator.load_fasttext_model(generator.URDU_EMBEDDINGS_PATH)
+    allowed_words = generator.load_filtered_wordlist(generator.WORDLIST_PATH)
+    return generator.get_word_embeddings_from_fasttext(model, allowed_words, max_words=generator.MAX_WORDS)
+
+
+def build_neighbour_index(word_vecs, top_k=TOP_K, block_size=BLOCK_SIZE):
+    """
+    Computes the top_k most similar neighbours (cosine) of every word, sorted by
+    decreasing similarity. The full similarity matrix is never materialised.
+    """
+    import numpy as np
+
+    words = list(word_vecs.keys())
+    vectors = np.vstack([word_vecs[w] for w in words]).astype(np.float64)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    vectors /= norms
+
+    top_k = min(top_k, len(words) - 1)
+    neighbours = np.empty((len(words), top_k), dtype=np.int32)
+    # float32, not float16: band edges need the precision the templates compare with
+    similarities = np.empty((len(words), top_k), dtype=np.float32)
+
+    for start in tqdm(range(0, len(words), block_size), desc="Building neighbour index"):
+        stop = min(start + block_size, len(words))
+        sim_block = vectors[start:stop] @ vectors.T
+        sim_block[np.arange(stop - start), np.arange(start, stop)] = -np.inf  # skip self similarity
+
+        top = np.argpartition(-sim_block, top_k - 1, axis=1)[:, :top_k]
+        top_sims = np.take_along_axis(sim_block, top, axis=1)
+        order = np.argsort(-top_sims, axis=1)
+
+        neighbours[start:stop] = np.take_along_axis(top, order, axis=1)
+        similarities[start:stop] = np.take_along_axis(top_sims, order, axis=1)
+
+    return {"words": np.array(words), "neighbours": neighbours, "similarities": similarities}
+
+
+def save_index(index, path):
+    import numpy as np
+
+    np.savez_compressed(path, **index)
+    print(f"Saved neighbour index for {len(index['words'])} words "
+          f"(top {index['neighbours'].shape[1]}) to {path}")
+
+
+def load_index(path):
+    import numpy as np
+
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"Neighbour index not found: {path}. Run the 'build' command first.")
+    with np.load(path) as data:
+        return {"words": data["words"], "neighbours": data["neighbours"], "similarities": data["similarities"]}
+
+
+def bands_for_levels(n_levels, min_sim, max_sim):
+    """Splits [min_sim, max_sim) into n_levels equally wide bands named 1..n_levels (1 = least similar)."""
+    import numpy as np
+
+    edges = np.linspace(min_sim, max_sim, n_levels + 1)
+    return {str(level + 1): (round(float(edges[level]), 6), round(float(edges[level + 1]), 6), "left")
+            for level in range(n_levels)}
+
+
+def parse_band(spec):
+    """
+    Parses NAME:MIN:MAX[:CLOSED], an empty MIN or MAX leaves that side of the band open.
+    CLOSED is 'left' (MIN <= sim < MAX, default) or 'right' (MIN < sim <= MAX).
+    """
+    try:
+        name, low, high, *closed = spec.split(":")
+        closed = closed[0] if closed else "left"
+        if closed not in ("left", "right"):
+            raise ValueError
+        return name, (float(low) if low else None, float(high) if high else None, closed)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid band '{spec}', expected NAME:MIN:MAX[:left|right]")
+
+
+def extract_pairs(index, bands):
+    """
+    For every start word picks the most similar neighbour inside each band, the same
+    selection the generator templates make when scanning a full similarity row.
+    """
+    import numpy as np
+
+    words = index["words"]
+    neighbours = index["neighbours"]
+    similarities = index["similarities"]
+
+    pairs = {}
+    not_reached = {}
+    for level, (low, high, closed) in bands.items():
+        in_band = np.ones(similarities.shape, dtype=bool)
+        if low is not None:
+            in_band &= similarities >= low if closed == "left" else similarities > low
+        if high is not None:
+            in_band &= similarities < high if closed == "left" else similarities <= high
+
+        has_pair = in_band.any(axis=1)
+        first = in_band.argmax(axis=1)  # neighbours are sorted, so the first hit is the most similar
+
+        pairs[level] = [{
+            "start": str(words[i]),
+            "target": str(words[neighbours[i, first[i]]]),
+            "similarity": round(float(similarities[i, first[i]]), 3),
+            "similarity_level": level
+        } for i in np.flatnonzero(has_pair)]
+
+        # the band may lie below the last stored neighbour, i.e. the index is too shallow for it
+        if low is not None:
+            not_reached[level] = int(np.sum(~has_pair & (similarities[:, -1] >= low)))
+        else:
+            not_reached[level] = int(np.sum(~has_pair))
+
+    for level, count in not_reached.items():
+        if count:
+            print(f"Warning: band '{level}' lies beyond the top {neighbours.shape[1]} neighbours "
+                  f"for {count} words, rebuild the index with a larger --top-k to cover them.")
+    return pairs
+
+
+def save_pairs_by_level(data, path):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+    counts = ", ".join(f"{len(pairs)} {level}" for level, pairs in data.items())
+    print(f"Saved {counts} similarity pairs to {path}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build a neighbour index once, extract similarity bands from it.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    build_parser = subparsers.add_parser("build", help="Compute the neighbour index from the embeddings")
+    build_parser.add_argument("language", choices=INDEX_FILES.keys())
+    build_parser.add_argument("--top-k", type=int, default=TOP_K)
+    build_parser.add_argument("--index", help="Index file, defaults to the per-language name")
+
+    extract_parser = subparsers.add_parser("extract", help="Write word pairs for the given bands from the index")
+    extract_parser.add_argument("language", choices=INDEX_FILES.keys())
+    extract_parser.add_argument("--index", help="Index file, defaults to the per-language name")
+    extract_parser.add_argument("--output", help="Output file, defaults to the per-language name")
+    extract_parser.add_argument("--band", action="append", type=parse_band, metavar="NAME:MIN:MAX[:left|right]",
+                                help="Similarity band, may be repeated. Defaults to the template bands.")
+    extract_parser.add_argument("--levels", type=int, help="Number of equally wide bands between --min and --max")
+    extract_parser.add_argument("--min", type=float, default=0.30)
+    extract_parser.add_argument("--max", type=float, default=0.90)
+
+    args = parser.parse_args()
+    index_path = args.index or INDEX_FILES[args.language]
+
+    if args.command == "build":
+        word_vecs = load_word_vectors(args.language)
+        print(f"Loaded {len(word_vecs)} word vectors.")
+        save_index(build_neighbour_index(word_vecs, top_k=args.top_k), index_path)
+        return
+
+    if args.band and args.levels:
+        parser.error("--band and --levels are mutually exclusive")
+    if args.band:
+        bands = dict(args.band)
+    elif args.levels:
+        bands = bands_for_levels(args.levels, args.min, args.max)
+    else:
+        bands = DEFAULT_BANDS[args.language]
+
+    index = load_index(index_path)
+    save_pairs_by_level(extract_pairs(index, bands), args.output or OUTPUT_FILES[args.language])
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,12 @@
-import nltk
 import json
-from nltk.corpus import wordnet as wn, stopwords
 from rapidfuzz.distance import Levenshtein
 from tqdm import tqdm
 import os
 
 
 def download_nltk_data():
+    import nltk
+    from nltk.corpus import wordnet as wn, stopwords
     try:
         wn.ensure_loaded()
     except LookupError:
@@ -22,6 +22,7 @@ def download_nltk_data():
 
 
 def get_wordnet_lemmas(min_length=3):
+    from nltk.corpus import wordnet as wn
     lemmas = set()
     for synset in wn.all_synsets(pos=wn.NOUN): 
         for lemma in synset.lemmas():
@@ -32,6 +33,7 @@ def get_wordnet_lemmas(min_length=3):
 
 
 def filter_stopwords(words):
+    from nltk.corpus import stopwords
     stop_words = set(stopwords.words('english'))
     return [w for w in words if w not in stop_words]
 
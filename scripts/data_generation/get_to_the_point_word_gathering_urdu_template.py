@@ -1,18 +1,24 @@
-import stanza
 import json
 import re
 from tqdm import tqdm
 from rapidfuzz.distance import Levenshtein
 
-stanza.download('ur')
-
-nlp = stanza.Pipeline(lang='ur', processors='tokenize,pos,lemma', use_gpu=False)
-
 LIST_PATH = "urd_news_2020_30K-words.txt" # from https://wortschatz.uni-leipzig.de/en/download/Urdu
 WORDLIST_OUTPUT = "filtered_wordlist_urdu.json"
 MIN_WORD_LENGTH = 3
 SIMILARITY_THRESHOLD = 0.8
 
+nlp = None
+
+def get_stanza_pipeline():
+    """Downloads the Urdu models and creates the Stanza pipeline on first use."""
+    global nlp
+    if nlp is None:
+        import stanza
+        stanza.download('ur')
+        nlp = stanza.Pipeline(lang='ur', processors='tokenize,pos,lemma', use_gpu=False)
+    return nlp
+
 def get_urdu_stopwords():
     stopwords_list = {
         "اور", "کا", "کی", "کو", "میں", "ہے", "ہیں", "تھا", "تھی", "تھے",
@@ -37,6 +43,9 @@ def get_urdu_nouns(file_path, min_length=MIN_WORD_LENGTH):
     # regex specifically for urd_news_2020_30K-words.txt
     urdu_char_pattern = re.compile(r'^[ \u0600-\u06FF]+$')
 
+    # outside the try: a missing stanza or failed download must not yield an empty word list
+    nlp = get_stanza_pipeline()
+
     try:
         with open(file_path, 'r', encoding='utf-8') as f:
             lines = f.readlines()
@@ -49,7 +58,6 @@ def get_urdu_nouns(file_path, min_length=MIN_WORD_LENGTH):
                 if len(word_text) >= min_length and urdu_char_pattern.match(word_text):
                     words_to_process.append(word_text)
 
-
         batch_size = 1000
         for i in tqdm(range(0, len(words_to_process), batch_size), desc="Stanza Processing Batches"):
             batch = words_to_process[i:i + batch_size]
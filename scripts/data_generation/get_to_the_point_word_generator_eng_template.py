@@ -1,7 +1,5 @@
 import json
-import numpy as np
 from tqdm import tqdm
-from scipy.spatial.distance import cdist
 
 
 GLOVE_PATH = "glove.6B.100d.txt"  # from: https://nlp.stanford.edu/data/glove.6B.zip
@@ -21,6 +19,7 @@ def load_filtered_wordlist(path):
 
 
 def load_glove_embeddings(glove_path, allowed_words=None, max_words=None):
+    import numpy as np
     embeddings = {}
     with open(glove_path, 'r', encoding='utf-8') as f:
         for line in tqdm(f, desc="Loading GloVe"):
@@ -35,6 +34,9 @@ def load_glove_embeddings(glove_path, allowed_words=None, max_words=None):
 
 
 def generate_similarity_pairs(word_vecs):
+    import numpy as np
+    from scipy.spatial.distance import cdist
+
     words = list(word_vecs.keys())
     vectors = np.vstack([word_vecs[w] for w in words])
     similarities = 1 - cdist(vectors, vectors, metric='cosine')
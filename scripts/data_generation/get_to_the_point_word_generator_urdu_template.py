@@ -1,9 +1,6 @@
 import json
-import numpy as np
 from tqdm import tqdm
-from scipy.spatial.distance import cdist
 import os
-import fasttext 
 
 URDU_EMBEDDINGS_PATH = "cc.ur.300.bin" # Changed to .bin
 WORDLIST_PATH = "filtered_wordlist_urdu.json"
@@ -22,6 +19,7 @@ fasttext_model = None
 def load_fasttext_model(path):
     """Loads a FastText model from a .bin file."""
     global fasttext_model
+    import fasttext
     if not os.path.exists(path):
         raise FileNotFoundError(f"FastText model file not found: {path}. Please download the .bin model.")
     print(f"Loading FastText model from {path} (this might take a moment)...")
@@ -66,6 +64,9 @@ def generate_similarity_pairs(word_vecs):
     """
     Generates pairs of words with 'low' and 'high' cosine similarity.
     """
+    import numpy as np
+    from scipy.spatial.distance import cdist
+
     words = list(word_vecs.keys())
     if not words:
         print("No words with embeddings to process. Returning empty pairs.")
@@ -0,0 +1,537 @@
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import queue
+import re
+import sys
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from urllib.parse import urlsplit
+
+
+# Local web frontend for collecting the human Seeker baseline. Every browser session
+# plays one GetToThePoint episode against a model Helper. The game master is
+# synchronous, so each episode runs in a worker thread; the human Seeker is a Model
+# whose responses are the guesses posted from the browser. Session state lives in
+# memory until the episode ends and is written to one JSON file per session after
+# every turn. Episode records are stored in the layout of clem run, next to the
+# session files, so clem score and clem transcribe work on SESSIONS_DIR.
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+GAME_DIR = os.path.join(REPO_ROOT, 'clembench', 'gettothepoint')
+SESSIONS_DIR = os.path.join(REPO_ROOT, 'results', 'human_baseline')
+HOST = "127.0.0.1"
+PORT = 8080
+MAX_SESSIONS = 64  # episodes played at the same time, one worker thread each
+GUESS_TIMEOUT = 600  # seconds a participant may take for one guess before the episode is aborted
+POLL_TIMEOUT = 25  # seconds a state request waits for a change before returning the current state
+MAX_BODY_SIZE = 16 * 1024
+LANGUAGES = ("english", "urdu")
+SESSION_ID_REGEX = re.compile(r'^[0-9a-f]{32}$')
+EPISODE_DIR_REGEX = re.compile(r'^episode_(\d+)$')
+# only written to the session file, never sent to the participant
+PRIVATE_KEYS = ("target_word", "helper_model", "records")
+# guards episode numbering and the files shared by all episodes of an experiment
+RECORDS_LOCK = threading.Lock()
+
+sys.path.insert(0, GAME_DIR)
+
+
+class SessionFullError(Exception):
+    pass
+
+
+def create_web_seeker_model(session):
+    """
+    Returns a clemcore Model that hands the current sentence fragment to the session
+    and blocks the game thread until the participant's guess arrives.
+    """
+    from clemcore.backends import Model, ModelSpec
+
+    class _WebSeekerModel(Model):
+        def __init__(self):
+            super().__init__(ModelSpec(model_name="human-web", backend="web"))
+            # clem names the results folder after each player's temperature
+            self.set_gen_args(temperature=0.0, max_tokens=100)
+
+        def generate_response(self, messages):
+            prompt = messages[-1]["content"] if messages else ""
+            session.request_guess(prompt)
+            try:
+                guess = session.guesses.get(timeout=GUESS_TIMEOUT)
+            except queue.Empty:
+                guess = None
+            # no response is a parse error, the game master then aborts the episode
+            response_text = f"GUESS:{guess}\nCOT: human player" if guess is not None else ""
+            return messages, {"response": response_text}, response_text
+
+    return _WebSeekerModel()
+
+
+def session_path(language, session_id):
+    return os.path.join(SESSIONS_DIR, language, f'{session_id}.json')
+
+
+def public_view(state):
+    """A session dict without PRIVATE_KEYS; the outcome reveals the target word once the episode is over."""
+    return {key: value for key, value in state.items() if key not in PRIVATE_KEYS}
+
+
+class Session:
+
+    def __init__(self, loop, language, experiment_index, experiment, instance, helper_model_name, participant):
+        self.loop = loop
+        self.session_id = uuid.uuid4().hex
+        self.language = language
+        self.experiment_index = experiment_index
+        self.experiment = experiment
+        self.instance = instance
+        self.helper_model_name = helper_model_name
+        self.participant = participant
+
+        self.guesses = queue.Queue()
+        self.status = "starting"
+        self.sentence = instance['current_sentence_fragment']
+        self.turns = []
+        self.outcome = None
+        self.version = 0
+        self.changed = asyncio.Event()
+        self.path = session_path(language, self.session_id)
+        self.records = None  # episode dir below SESSIONS_DIR, set once the episode starts
+        self.task = None
+        self.started_at = time.time()
+
+    def to_dict(self):
+        return {
+            "session_id": self.session_id,
+            "participant": self.participant,
+            "language": self.language,
+            "experiment": self.experiment['name'],
+            "game_id": self.instance['game_id'],
+            "start_word": self.instance['start_word'],
+            "target_word": self.instance['target_word'],
+            "helper_model": self.helper_model_name,
+            "maximum_seeker_guesses": self.experiment['maximum_seeker_guesses'],
+            "status": self.status,
+            "sentence": self.sentence,
+            "turns": self.turns,
+            "outcome": self.outcome,
+            "records": self.records,
+            "started_at": self.started_at,
+            "version": self.version
+        }
+
+    def public_state(self):
+        return public_view(self.to_dict())
+
+    def _changed(self):
+        """Persists the session and wakes up waiting state requests. Runs on the event loop."""
+        self.version += 1
+        self.persist()
+        self.changed.set()
+        self.changed = asyncio.Event()
+
+    def persist(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = f'{self.path}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+
+    def request_guess(self, sentence):
+        """Called from the game thread when the Seeker has to answer."""
+        self.loop.call_soon_threadsafe(self._on_guess_requested, sentence)
+
+    def _on_guess_requested(self, sentence):
+        self.status = "waiting_for_guess"
+        self.sentence = sentence
+        self._changed()
+
+    def submit_guess(self, guess):
+        if self.status != "waiting_for_guess":
+            raise ValueError(f"No guess expected, session is {self.status}")
+        self.turns.append({"sentence": self.sentence, "guess": guess, "time": time.time()})
+        self.status = "waiting_for_helper"
+        self.guesses.put(guess)
+        self._changed()
+
+    def finish(self, outcome):
+        self.status = "finished"
+        self.outcome = outcome
+        self._changed()
+
+    async def wait_for_change(self, version, timeout=POLL_TIMEOUT):
+        if version >= self.version:
+            try:
+                await asyncio.wait_for(self.changed.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+        return self.public_state()
+
+
+def load_game_benchmark():
+    """The game's own GameBenchmark, so episodes are created as clem run creates them."""
+    from clemcore.clemgame import GameSpec
+    from master import GetToThePointGameBenchmark
+
+    return GetToThePointGameBenchmark(GameSpec.from_directory(GAME_DIR)[0])
+
+
+def prepare_records(session, game_name, dialogue_pair_desc, experiment_config):
+    """
+    Creates the next free episode dir of the session's experiment below SESSIONS_DIR,
+    numbered as clem run numbers them, with its instance.json; the first episode of an
+    experiment also writes its experiment.json. Returns the episode dir relative to
+    the game's results dir, as store_records expects it.
+    """
+    from clemcore.clemgame.resources import store_results_file
+
+    experiment_dir = f"{session.experiment_index}_{session.experiment['name']}"
+    experiment_path = os.path.join(SESSIONS_DIR, dialogue_pair_desc, game_name, experiment_dir)
+    with RECORDS_LOCK:
+        if not os.path.exists(os.path.join(experiment_path, 'experiment.json')):
+            store_results_file(game_name, experiment_config, 'experiment.json', dialogue_pair_desc,
+                               sub_dir=experiment_dir, results_dir=SESSIONS_DIR)
+        taken = [int(match.group(1)) for match in map(EPISODE_DIR_REGEX.match, os.listdir(experiment_path)) if match]
+        episode_dir = f"{experiment_dir}/episode_{max(taken, default=-1) + 1}"
+        store_results_file(game_name, session.instance, 'instance.json', dialogue_pair_desc,
+                           sub_dir=episode_dir, results_dir=SESSIONS_DIR)
+    return episode_dir
+
+
+def play_episode(session, game_benchmark, helper_model):
+    """Runs one episode in a worker thread, stores its records and returns its outcome."""
+    from clemcore.clemgame import DefaultGameRecorder
+
+    player_models = [helper_model, create_web_seeker_model(session)]
+    game_name = game_benchmark.game_name
+    dialogue_pair_desc = game_benchmark.get_dialogue_pair_descriptor(player_models)
+    experiment_config = {key: value for key, value in session.experiment.items() if key != 'game_instances'}
+    experiment_config.update(timestamp=datetime.now().isoformat(), dialogue_partners=dialogue_pair_desc)
+    episode_dir = prepare_records(session, game_name, dialogue_pair_desc, experiment_config)
+    session.records = os.path.join(dialogue_pair_desc, game_name, episode_dir)
+
+    game_master = game_benchmark.create_game_master(experiment_config, player_models)
+    game_master.game_recorder = DefaultGameRecorder(game_name, session.experiment['name'], session.instance['game_id'],
+                                                    dialogue_pair_desc)
+    game_master.setup(**session.instance)
+    game_master.play()
+    game_master.store_records(SESSIONS_DIR, dialogue_pair_desc, episode_dir)
+    return {
+        "success": game_master.state.success,
+        "lose": game_master.state.failure,
+        "aborted": game_master.state.aborted,
+        "rounds": game_master.current_round + 1,
+        "score": game_master.compute_episode_score(),
+        "target_word": session.instance['target_word']
+    }
+
+
+class SessionManager:
+
+    def __init__(self, helper_model_name, max_sessions=MAX_SESSIONS):
+        self.helper_model_name = helper_model_name
+        self.max_sessions = max_sessions
+        self.executor = ThreadPoolExecutor(max_workers=max_sessions, thread_name_prefix="episode")
+        self.game_benchmark = load_game_benchmark()
+        self.sessions = {}  # sessions still playing; finished ones are read back from their files
+        self.instance_cycles = {}
+        self.helper_models = {}
+
+    def _next_instance(self, language):
+        """Round-robin over all instances of the language, so levels are covered evenly."""
+        if language not in self.instance_cycles:
+            with open(os.path.join(GAME_DIR, 'in', f'instances_{language}.json'), 'r', encoding='utf-8') as f:
+                instances = json.load(f)
+            pairs = [(index, experiment, instance) for index, experiment in enumerate(instances['experiments'])
+                     for instance in experiment['game_instances']]
+            if not pairs:
+                raise ValueError(f"No instances found for language '{language}'")
+            self.instance_cycles[language] = itertools.cycle(pairs)
+        return next(self.instance_cycles[language])
+
+    def _helper_model(self):
+        """One helper model per worker thread, backends are not guaranteed to be thread-safe."""
+        from clemcore.backends import BackendRegistry, ModelRegistry
+
+        key = threading.get_ident()
+        if key not in self.helper_models:
+            model_spec = ModelRegistry.from_packaged_and_cwd_files().get_first_model_spec_that_unify_with(
+                self.helper_model_name)
+            backend = BackendRegistry.from_packaged_and_cwd_files().get_backend_for(model_spec.backend)
+            model = backend.get_model_for(model_spec)
+            model.set_gen_args(temperature=0.0, max_tokens=100)
+            self.helper_models[key] = model
+        return self.helper_models[key]
+
+    def active_sessions(self):
+        return len(self.sessions)
+
+    def create_session(self, language, participant):
+        if self.active_sessions() >= self.max_sessions:
+            raise SessionFullError(f"All {self.max_sessions} session slots are in use")
+        experiment_index, experiment, instance = self._next_instance(language)
+        session = Session(asyncio.get_running_loop(), language, experiment_index, experiment, instance,
+                          self.helper_model_name, participant)
+        self.sessions[session.session_id] = session
+        session.persist()
+        session.task = asyncio.create_task(self._run(session))
+        return session
+
+    async def _run(self, session):
+        loop = asyncio.get_running_loop()
+        try:
+            outcome = await loop.run_in_executor(
+                self.executor, lambda: play_episode(session, self.game_benchmark, self._helper_model()))
+        except Exception as e:
+            outcome = {"error": f"{type(e).__name__}: {e}"}
+        session.finish(outcome)  # persists the final state, which finished_state reads back
+        del self.sessions[session.session_id]
+
+    def finished_state(self, session_id):
+        """Public state of a finished session from its file, None if there is no such session."""
+        if not SESSION_ID_REGEX.match(session_id):
+            return None
+        for language in LANGUAGES:
+            path = session_path(language, session_id)
+            if os.path.exists(path):
+                with open(path, 'r', encoding='utf-8') as f:
+                    return public_view(json.load(f))
+        return None
+
+    def shutdown(self):
+        for session in self.sessions.values():
+            if session.status == "waiting_for_guess":
+                session.guesses.put(None)
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+PAGE = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>Get to the Point</title>
+<style>
+  body { font-family: sans-serif; max-width: 40em; margin: 2em auto; }
+  #sentence { font-size: 1.6em; margin: 1em 0; }
+  .hidden { display: none; }
+</style>
+</head>
+<body>
+<h1>Get to the Point</h1>
+<div id="start">
+  <p>You are the Seeker: the Helper builds a sentence that leads to a hidden target word. Guess one word per turn.</p>
+  <label>Participant id <input id="participant"></label>
+  <label>Language <select id="language"><option value="english">English</option><option value="urdu">Urdu</option></select></label>
+  <button id="start-button">Start</button>
+</div>
+<div id="game" class="hidden">
+  <p id="turn"></p>
+  <p id="sentence"></p>
+  <form id="guess-form"><input id="guess" autocomplete="off" pattern="\\S+" title="A single word, no spaces"> <button>Guess</button></form>
+  <p>Guess exactly one word per turn.</p>
+  <p id="status"></p>
+</div>
+<script>
+let sessionId = null, version = -1;
+const $ = id => document.getElementById(id);
+
+async function call(method, path, body) {
+  const response = await fetch(path, {method, headers: {"Content-Type": "application/json"},
+                                      body: body ? JSON.stringify(body) : undefined});
+  const data = await response.json();
+  if (!response.ok) throw new Error(data.error);
+  return data;
+}
+
+function render(state) {
+  version = state.version;
+  $("game").dir = state.language === "urdu" ? "rtl" : "ltr";
+  $("sentence").textContent = state.sentence;
+  $("turn").textContent = `Guess ${Math.min(state.turns.length + 1, state.maximum_seeker_guesses)} of ${state.maximum_seeker_guesses}`;
+  $("guess-form").classList.toggle("hidden", state.status !== "waiting_for_guess");
+  if (state.status === "finished") {
+    const outcome = state.outcome;
+    $("status").textContent = outcome.error ? `The game stopped: ${outcome.error}` :
+      (outcome.success ? "Correct!" : "Game over.") + ` The target word was "${outcome.target_word}".`;
+  } else {
+    $("status").textContent = state.status === "waiting_for_guess" ? "" : "Waiting for the Helper...";
+  }
+  return state.status !== "finished";
+}
+
+async function poll() {
+  try {
+    while (render(await call("GET", `/sessions/${sessionId}?version=${version}`))) {}
+  } catch (e) {
+    $("status").textContent = e.message;
+  }
+}
+
+$("start-button").onclick = async () => {
+  try {
+    const state = await call("POST", "/sessions", {participant: $("participant").value, language: $("language").value});
+    sessionId = state.session_id;
+    $("start").classList.add("hidden");
+    $("game").classList.remove("hidden");
+    poll();
+  } catch (e) {
+    alert(e.message);
+  }
+};
+
+$("guess-form").onsubmit = async event => {
+  event.preventDefault();
+  const guess = $("guess").value.trim();
+  if (!guess) return;
+  try {
+    await call("POST", `/sessions/${sessionId}/guess`, {guess});
+    $("guess").value = "";
+  } catch (e) {
+    $("status").textContent = e.message;
+  }
+};
+</script>
+</body>
+</html>
+"""
+
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 409: "Conflict", 413: "Payload Too Large",
+           503: "Service Unavailable"}
+
+
+class HttpError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+async def read_request(reader):
+    """Parses a request into (method, path, query, json body); only what the page above sends."""
+    head = await reader.readuntil(b"\r\n\r\n")
+    request_line, *header_lines = head.decode("latin-1").split("\r\n")
+    method, target, _ = request_line.split(" ", 2)
+    headers = {}
+    for line in header_lines:
+        if ":" in line:
+            key, value = line.split(":", 1)
+            headers[key.strip().lower()] = value.strip()
+
+    length = int(headers.get("content-length", 0))
+    if length > MAX_BODY_SIZE:
+        raise HttpError(413, "Request body too large")
+    body = {}
+    if length:
+        try:
+            body = json.loads(await reader.readexactly(length))
+        except json.JSONDecodeError:
+            raise HttpError(400, "Request body is not valid JSON")
+        if not isinstance(body, dict):
+            raise HttpError(400, "Request body must be a JSON object")
+
+    url = urlsplit(target)
+    query = dict(part.split("=", 1) for part in url.query.split("&") if "=" in part)
+    return method, url.path, query, body
+
+
+async def write_response(writer, status, body, content_type="application/json"):
+    payload = body.encode("utf-8") if isinstance(body, str) else json.dumps(body, ensure_ascii=False).encode("utf-8")
+    writer.write(f"HTTP/1.1 {status} {REASONS.get(status, '')}\r\n"
+                 f"Content-Type: {content_type}; charset=utf-8\r\n"
+                 f"Content-Length: {len(payload)}\r\n"
+                 f"Connection: close\r\n\r\n".encode("latin-1") + payload)
+    await writer.drain()
+
+
+async def route(manager, method, path, query, body):
+    parts = [part for part in path.split("/") if part]
+    if method == "GET" and not parts:
+        return 200, PAGE
+
+    if parts[:1] == ["sessions"] and len(parts) == 1 and method == "POST":
+        language = body.get("language")
+        if language not in LANGUAGES:
+            raise HttpError(400, "language must be 'english' or 'urdu'")
+        try:
+            session = manager.create_session(language, str(body.get("participant", "")))
+        except SessionFullError as e:
+            raise HttpError(503, str(e))
+        return 200, session.public_state()
+
+    if parts[:1] == ["sessions"] and len(parts) >= 2:
+        session = manager.sessions.get(parts[1])
+        if session is None:
+            state = manager.finished_state(parts[1])
+            if state is None:
+                raise HttpError(404, f"Unknown session {parts[1]}")
+            if len(parts) == 2 and method == "GET":
+                return 200, state
+            raise HttpError(409, f"Session {parts[1]} is {state['status']}")
+        if len(parts) == 2 and method == "GET":
+            version = int(query.get("version", -1)) if query.get("version", "").lstrip("-").isdigit() else -1
+            return 200, await session.wait_for_change(version)
+        if parts[2:] == ["guess"] and method == "POST":
+            guess = str(body.get("guess", "")).strip()
+            if not guess:
+                raise HttpError(400, "guess must not be empty")
+            if len(guess.split()) > 1:
+                # the game master fails the whole episode on a multi-word guess
+                raise HttpError(400, "Guess a single word")
+            try:
+                session.submit_guess(guess)
+            except ValueError as e:
+                raise HttpError(409, str(e))
+            return 200, session.public_state()
+
+    raise HttpError(404, f"No route for {method} {path}")
+
+
+async def handle_connection(manager, reader, writer):
+    try:
+        try:
+            method, path, query, body = await read_request(reader)
+            status, response = await route(manager, method, path, query, body)
+        except HttpError as e:
+            status, response = e.status, {"error": str(e)}
+        except (ValueError, asyncio.LimitOverrunError):
+            status, response = 400, {"error": "Malformed request"}
+        content_type = "text/html" if isinstance(response, str) else "application/json"
+        await write_response(writer, status, response, content_type)
+    except (asyncio.IncompleteReadError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+
+
+async def serve(helper_model_name, host, port, max_sessions):
+    manager = SessionManager(helper_model_name, max_sessions)
+    server = await asyncio.start_server(lambda r, w: handle_connection(manager, r, w), host, port)
+    print(f"Serving human Seeker sessions against '{helper_model_name}' on http://{host}:{port}/")
+    print(f"Sessions are saved to {SESSIONS_DIR}")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        manager.shutdown()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Web frontend for human Seeker sessions of GetToThePoint.")
+    parser.add_argument("-m", "--helper-model", required=True, help="Model playing the Helper")
+    parser.add_argument("--host", default=HOST)
+    parser.add_argument("--port", type=int, default=PORT)
+    parser.add_argument("--max-sessions", type=int, default=MAX_SESSIONS)
+    args = parser.parse_args()
+    try:
+        asyncio.run(serve(args.helper_model, args.host, args.port, args.max_sessions))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
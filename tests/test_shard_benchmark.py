@@ -0,0 +1,124 @@
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts', 'benchmark'))
+import shard_benchmark  # noqa: E402
+
+INSTANCES = {"experiments": [
+    {"name": f"exp_level_{level}_english", "maximum_seeker_guesses": 7,
+     "game_instances": [{"game_id": game_id, "start_word": "navigator", "target_word": "user"}
+                        for game_id in range(10, 16)]}
+    for level in ("low", "high")
+]}
+MODEL_PAIR = "mock-t0.0--mock-t0.0"
+
+
+@pytest.fixture(autouse=True)
+def synthetic_instances(monkeypatch):
+    monkeypatch.setattr(shard_benchmark, "load_instances", lambda language: INSTANCES)
+
+
+def write_results(results_dir, instances, timestamp, experiment_overrides=None):
+    """Writes the results tree clem would produce for one run: episodes numbered from 0, each with its instance.json."""
+    for index, experiment in enumerate(instances["experiments"]):
+        experiment_dir = os.path.join(results_dir, MODEL_PAIR, shard_benchmark.GAME, f"{index}_{experiment['name']}")
+        os.makedirs(experiment_dir)
+        experiment_config = {"name": experiment["name"], "maximum_seeker_guesses": 7,
+                             "timestamp": timestamp, "dialogue_partners": MODEL_PAIR}
+        experiment_config.update(experiment_overrides or {})
+        with open(os.path.join(experiment_dir, "experiment.json"), "w") as f:
+            json.dump(experiment_config, f)
+        for episode_counter, instance in enumerate(experiment["game_instances"]):
+            episode_dir = os.path.join(experiment_dir, f"episode_{episode_counter}")
+            os.makedirs(episode_dir)
+            with open(os.path.join(episode_dir, "instance.json"), "w") as f:
+                json.dump(instance, f)
+            with open(os.path.join(episode_dir, "interactions.json"), "w") as f:
+                json.dump({"meta": {"experiment_name": experiment["name"], "game_id": instance["game_id"]}}, f)
+
+
+def write_shard_results(results_root, n_shards, timestamps, experiment_overrides=None):
+    """Writes the results of every shard, one timestamp per shard."""
+    for shard, shard_instances in enumerate(shard_benchmark.split_instances(INSTANCES, n_shards)):
+        write_results(shard_benchmark.shard_results_dir(results_root, shard), shard_instances, timestamps[shard],
+                      (experiment_overrides or {}).get(shard))
+
+
+def read_tree(results_dir):
+    """Maps every file below results_dir to its content, without the run-specific experiment.json keys."""
+    tree = {}
+    for dirpath, _, filenames in os.walk(results_dir):
+        for filename in filenames:
+            path = os.path.join(dirpath, filename)
+            if filename == "experiment.json":
+                content = shard_benchmark.load_experiment_config(path)
+            else:
+                with open(path) as f:
+                    content = json.load(f)
+            tree[os.path.relpath(path, results_dir)] = content
+    return tree
+
+
+def test_split_assigns_every_instance_to_exactly_one_shard():
+    shards = shard_benchmark.split_instances(INSTANCES, 2)
+    assigned = sorted((experiment["name"], instance["game_id"])
+                      for shard in shards for experiment in shard["experiments"]
+                      for instance in experiment["game_instances"])
+    expected = sorted((experiment["name"], instance["game_id"])
+                      for experiment in INSTANCES["experiments"] for instance in experiment["game_instances"])
+    assert assigned == expected
+    assert all(len(shard["experiments"]) == len(INSTANCES["experiments"]) for shard in shards)
+    assert shards == shard_benchmark.split_instances(INSTANCES, 2)
+
+
+def test_merge_ignores_run_specific_experiment_keys(tmp_path):
+    results_root, output_dir = str(tmp_path / "shards"), str(tmp_path / "merged")
+    write_shard_results(results_root, 2, ["2025-06-30T13:17:56.591193", "2025-06-30T14:02:11.104512"],
+                        {1: {"duration": "0:01:02"}})
+
+    assert shard_benchmark.merge_shards("english", 2, results_root, output_dir) == []
+
+    merged = shard_benchmark.collect_episodes(output_dir)
+    assert len(merged) == sum(len(experiment["game_instances"]) for experiment in INSTANCES["experiments"])
+    for index, experiment in enumerate(INSTANCES["experiments"]):
+        experiment_dir = os.path.join(output_dir, MODEL_PAIR, shard_benchmark.GAME, f"{index}_{experiment['name']}")
+        experiment_files = [name for name in os.listdir(experiment_dir) if name.endswith(".json")]
+        assert experiment_files == ["experiment.json"]
+
+
+def test_merged_tree_matches_single_node_run(tmp_path):
+    results_root, output_dir = str(tmp_path / "shards"), str(tmp_path / "merged")
+    single_node_dir = str(tmp_path / "single")
+    write_shard_results(results_root, 3, ["t0", "t1", "t2"])
+    write_results(single_node_dir, INSTANCES, "t")
+
+    assert shard_benchmark.merge_shards("english", 3, results_root, output_dir) == []
+    assert read_tree(output_dir) == read_tree(single_node_dir)
+
+
+def test_merge_rejects_differing_experiment_config(tmp_path):
+    results_root, output_dir = str(tmp_path / "shards"), str(tmp_path / "merged")
+    write_shard_results(results_root, 2, ["t0", "t1"], {1: {"maximum_seeker_guesses": 5}})
+
+    problems = shard_benchmark.merge_shards("english", 2, results_root, output_dir)
+    assert problems and all("differs" in problem for problem in problems)
+    assert not os.path.exists(output_dir)
+
+
+def test_merge_reports_missing_episodes(tmp_path):
+    results_root, output_dir = str(tmp_path / "shards"), str(tmp_path / "merged")
+    write_shard_results(results_root, 2, ["t0", "t1"])
+    missing = os.path.join(shard_benchmark.shard_results_dir(results_root, 1), MODEL_PAIR, shard_benchmark.GAME,
+                           "1_exp_level_high_english", "episode_0")
+    with open(os.path.join(missing, "instance.json")) as f:
+        game_id = json.load(f)["game_id"]
+    os.rename(missing, missing + "_removed")
+
+    problems = shard_benchmark.merge_shards("english", 2, results_root, output_dir)
+    # named as in a single-node run, where game ids 10..15 are episodes 0..5
+    expected_path = os.path.join(MODEL_PAIR, shard_benchmark.GAME, "1_exp_level_high_english", f"episode_{game_id - 10}")
+    assert problems == [f"missing episode {expected_path} (game id {game_id})"]
+    assert not os.path.exists(output_dir)
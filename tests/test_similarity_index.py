@@ -0,0 +1,47 @@
+import os
+import sys
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("scipy")
+pytest.importorskip("tqdm")
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts', 'data_generation'))
+import get_to_the_point_similarity_index as similarity_index  # noqa: E402
+import get_to_the_point_word_generator_eng_template as eng_template  # noqa: E402
+import get_to_the_point_word_generator_urdu_template as urdu_template  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def word_vecs():
+    """Clustered random vectors, so that both the low and the high bands of both templates get pairs."""
+    rng = np.random.default_rng(0)
+    centres = rng.normal(size=(40, 50))
+    return {f"w{i}": centres[i % len(centres)] + rng.normal(size=50) * 1.2 for i in range(1200)}
+
+
+@pytest.fixture(scope="module")
+def index(word_vecs):
+    return similarity_index.build_neighbour_index(word_vecs, top_k=len(word_vecs) - 1, block_size=256)
+
+
+@pytest.mark.parametrize("language, template", [("english", eng_template), ("urdu", urdu_template)])
+def test_extracted_pairs_match_template(word_vecs, index, language, template):
+    expected = template.generate_similarity_pairs({word: vec.copy() for word, vec in word_vecs.items()})
+    extracted = similarity_index.extract_pairs(index, similarity_index.DEFAULT_BANDS[language])
+
+    for level in ("low", "high"):
+        assert expected[level], f"no {language} {level} pairs, the fixture does not cover the band"
+        assert ([(pair["start"], pair["target"]) for pair in extracted[level]]
+                == [(pair["start"], pair["target"]) for pair in expected[level]])
+
+
+def test_index_survives_save_and_load(index, tmp_path):
+    path = str(tmp_path / "index.npz")
+    similarity_index.save_index(index, path)
+    loaded = similarity_index.load_index(path)
+
+    assert loaded["similarities"].dtype == np.float32
+    for key in ("words", "neighbours", "similarities"):
+        assert np.array_equal(loaded[key], index[key])